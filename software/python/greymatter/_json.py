@@ -0,0 +1,31 @@
+"""JSON encoding for the ZMQ wire format.
+
+Uses ``orjson`` when it is installed (``pip install greymatter[server]``)
+and falls back to the standard library otherwise.  Both functions work in
+bytes, which is what ZMQ frames carry.
+"""
+
+from __future__ import annotations
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    import json
+
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps(obj) -> bytes:
+        """Serialize *obj* to compact JSON bytes."""
+        return _encoder.encode(obj).encode()
+
+    def loads(data):
+        """Parse JSON from bytes, str, or a buffer such as a memoryview."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
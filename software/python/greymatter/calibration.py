@@ -1,10 +1,62 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import struct
+from typing import TYPE_CHECKING, Any, Callable
+
+from .components import CurrentDAC, VoltageDAC
 
 if TYPE_CHECKING:
     from .controller import GreyMatter
 
+# Channels per DAC index on each board
+_DAC_CHANNELS = (
+    CurrentDAC.num_channels, CurrentDAC.num_channels, VoltageDAC.num_channels,
+)
+
+# Firmware values for a channel that has never been calibrated
+_CAL_DEFAULTS = {"gain": 1.0, "offset": 0.0, "enabled": False}
+
+
+def _as_reported(value: float) -> float | None:
+    """Round *value* the way the firmware stores and reports it.
+
+    The firmware keeps a float32 and prints it with ``%.6f``. Returns
+    None for values too large for a float32.
+    """
+    try:
+        (stored,) = struct.unpack("<f", struct.pack("<f", value))
+    except OverflowError:
+        return None
+    return float(f"{stored:.6f}")
+
+
+def _parse_cal_data(text: str) -> dict[tuple[int, int, int], dict[str, Any]]:
+    """Parse ``CAL:DATA?`` output into per-channel calibration dicts.
+
+    Each board starts with a "BOARD<n>:SN=..." header, followed by
+    "  DAC<m>:CH<c>:G=<gain>,O=<offset>,E=<0|1>" lines for channels whose
+    calibration differs from the defaults. Every channel of every listed
+    board is present in the result.
+    """
+    cal: dict[tuple[int, int, int], dict[str, Any]] = {}
+    board = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("BOARD"):
+            board = int(line[5:line.index(":")])
+            for dac, num_channels in enumerate(_DAC_CHANNELS):
+                for ch in range(num_channels):
+                    cal[(board, dac, ch)] = dict(_CAL_DEFAULTS)
+        elif line.startswith("DAC") and board is not None:
+            dac_part, ch_part, values = line.split(":", 2)
+            fields = dict(kv.split("=", 1) for kv in values.split(","))
+            cal[(board, int(dac_part[3:]), int(ch_part[2:]))] = {
+                "gain": float(fields["G"]),
+                "offset": float(fields["O"]),
+                "enabled": fields["E"] == "1",
+            }
+    return cal
+
 
 class GreyMatterCalibration:
     """Calibration interface for the greymatter DAC controller.
@@ -16,31 +68,77 @@ class GreyMatterCalibration:
         cal = GreyMatterCalibration(gm)
         cal.set_gain(board=0, dac=0, channel=0, gain=0.999)
         cal.save()
+
+    Values read back are cached per channel and kept up to date by the
+    setters, so repeated reads cost no round-trips (a setter inside
+    ``gm.pipeline()`` drops the cached value instead). Call ``refresh()``
+    if the calibration may have changed behind this object's back
+    (e.g. after ``gm.reset()``, which reloads it from flash).
     """
 
     def __init__(self, gm: GreyMatter):
         self._gm = gm
+        self._prefixes: dict[tuple[int, int, int], str] = {}
+        self._cache: dict[tuple[int, int, int], dict[str, Any]] = {}
 
     def _ch_prefix(self, board: int, dac: int, channel: int) -> str:
-        return f"BOARD{board}:DAC{dac}:CH{channel}"
+        key = (board, dac, channel)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = self._prefixes[key] = f"BOARD{board}:DAC{dac}:CH{channel}"
+        return prefix
+
+    def _get(self, board: int, dac: int, channel: int, field: str,
+             query: str, parse: Callable[[str], Any]) -> Any:
+        entry = self._cache.setdefault((board, dac, channel), {})
+        if field not in entry:
+            entry[field] = parse(
+                self._gm.query(f"{self._ch_prefix(board, dac, channel)}:{query}")
+            )
+        return entry[field]
+
+    def _set(self, board: int, dac: int, channel: int, field: str,
+             value: Any) -> None:
+        entry = self._cache.setdefault((board, dac, channel), {})
+        # Inside a pipeline the command is only queued and may never reach
+        # the device, so leave the field to be re-queried instead
+        if self._gm._batch is not None or value is None:
+            entry.pop(field, None)
+        else:
+            entry[field] = value
 
     def get_gain(self, board: int, dac: int, channel: int) -> float:
-        return float(self._gm.query(f"{self._ch_prefix(board, dac, channel)}:CAL:GAIN?"))
+        return self._get(board, dac, channel, "gain", "CAL:GAIN?", float)
 
     def set_gain(self, board: int, dac: int, channel: int, gain: float) -> None:
         self._gm.command(f"{self._ch_prefix(board, dac, channel)}:CAL:GAIN {gain}")
+        self._set(board, dac, channel, "gain", _as_reported(gain))
 
     def get_offset(self, board: int, dac: int, channel: int) -> float:
-        return float(self._gm.query(f"{self._ch_prefix(board, dac, channel)}:CAL:OFFS?"))
+        return self._get(board, dac, channel, "offset", "CAL:OFFS?", float)
 
     def set_offset(self, board: int, dac: int, channel: int, offset: float) -> None:
         self._gm.command(f"{self._ch_prefix(board, dac, channel)}:CAL:OFFS {offset}")
+        self._set(board, dac, channel, "offset", _as_reported(offset))
 
     def get_enabled(self, board: int, dac: int, channel: int) -> bool:
-        return self._gm.query(f"{self._ch_prefix(board, dac, channel)}:CAL:EN?") == "1"
+        return self._get(board, dac, channel, "enabled", "CAL:EN?",
+                         lambda resp: resp == "1")
 
     def set_enabled(self, board: int, dac: int, channel: int, enabled: bool) -> None:
         self._gm.command(f"{self._ch_prefix(board, dac, channel)}:CAL:EN {1 if enabled else 0}")
+        self._set(board, dac, channel, "enabled", bool(enabled))
+
+    def refresh(self, bulk: bool = False) -> None:
+        """Drop cached calibration values.
+
+        With ``bulk=True`` the cache is refilled for every channel from a
+        single ``CAL:DATA?`` query instead of being repopulated lazily.
+        """
+        self._cache.clear()
+        if not bulk:
+            return
+        self._cache.update(_parse_cal_data(self.export_data()))
 
     def save(self) -> None:
         """Save calibration data to flash."""
@@ -48,12 +146,35 @@ class GreyMatterCalibration:
 
     def load(self) -> None:
         """Load calibration data from flash."""
+        self._cache.clear()
         self._gm.command("CAL:LOAD")
 
     def clear(self) -> None:
         """Clear all calibration data (RAM and flash)."""
+        self._cache.clear()
         self._gm.command("CAL:CLEAR")
 
     def export_data(self) -> str:
         """Export all calibration data as a formatted string."""
         return self._gm.query("CAL:DATA?")
+
+    def export_data_parsed(self):
+        """Export all calibration data as a numpy array.
+
+        Returns a float array of shape ``(num_boards, 3, 5, 3)`` indexed
+        by board, DAC and channel, holding ``(gain, offset, enabled)``.
+        Entries for channels that do not exist (channel 4 of the voltage
+        DAC) are NaN. Requires numpy.
+        """
+        import numpy as np
+
+        cal = _parse_cal_data(self.export_data())
+        num_boards = max((board for board, _, _ in cal), default=-1) + 1
+        data = np.full(
+            (num_boards, len(_DAC_CHANNELS), max(_DAC_CHANNELS), 3), np.nan
+        )
+        for (board, dac, ch), entry in cal.items():
+            data[board, dac, ch] = (
+                entry["gain"], entry["offset"], entry["enabled"],
+            )
+        return data
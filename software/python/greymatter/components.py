@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Union
 
 from .spans import CurrentSpan, VoltageSpan
@@ -7,6 +8,37 @@ from .spans import CurrentSpan, VoltageSpan
 if TYPE_CHECKING:
     from .controller import GreyMatter
 
+# SCPI argument strings for every known span code
+_SPAN_ARGS: dict[int, str] = {
+    int(span): str(int(span)) for span in (*CurrentSpan, *VoltageSpan)
+}
+
+
+def _span_arg(span: int) -> str:
+    return _SPAN_ARGS.get(span) or str(int(span))
+
+
+@dataclass(frozen=True)
+class CurrentDACFault:
+    """Decoded LTC2662 fault register (see ``CurrentDAC.fault_status``)."""
+
+    oc0: bool = False
+    oc1: bool = False
+    oc2: bool = False
+    oc3: bool = False
+    oc4: bool = False
+    overtemp: bool = False
+    power_limit: bool = False
+    invalid_spi: bool = False
+
+
+# Firmware fault names -> CurrentDACFault fields
+_FAULT_FIELDS = {
+    "OC0": "oc0", "OC1": "oc1", "OC2": "oc2", "OC3": "oc3", "OC4": "oc4",
+    "OVERTEMP": "overtemp", "POWER_LIMIT": "power_limit",
+    "INVALID_SPI": "invalid_spi",
+}
+
 
 class Board:
     """Represents one daughter board (index 0-7)."""
@@ -14,17 +46,16 @@ class Board:
     def __init__(self, gm: GreyMatter, board_id: int):
         self._gm = gm
         self._id = board_id
-        self._dacs: dict[int, Union[CurrentDAC, VoltageDAC]] = {}
+        self._dacs: list[Union[CurrentDAC, VoltageDAC]] = [
+            CurrentDAC(gm, board_id, 0),
+            CurrentDAC(gm, board_id, 1),
+            VoltageDAC(gm, board_id, 2),
+        ]
 
     def dac(self, dac_id: int) -> Union["CurrentDAC", "VoltageDAC"]:
         """Return DAC 0-2. DAC 0,1 are CurrentDAC; DAC 2 is VoltageDAC."""
         if dac_id < 0 or dac_id > 2:
             raise ValueError("dac_id must be 0-2")
-        if dac_id not in self._dacs:
-            if dac_id < 2:
-                self._dacs[dac_id] = CurrentDAC(self._gm, self._id, dac_id)
-            else:
-                self._dacs[dac_id] = VoltageDAC(self._gm, self._id, dac_id)
         return self._dacs[dac_id]
 
     @property
@@ -50,21 +81,38 @@ class CurrentDAC:
         self._gm = gm
         self._board = board_id
         self._dac = dac_id
-        self._channels: dict[int, CurrentChannel] = {}
+        self._channels: list[CurrentChannel] = [
+            CurrentChannel(gm, board_id, dac_id, ch)
+            for ch in range(self.num_channels)
+        ]
+        self._prefix_str = f"BOARD{board_id}:DAC{dac_id}"
 
     def _prefix(self) -> str:
-        return f"BOARD{self._board}:DAC{self._dac}"
+        return self._prefix_str
 
     def channel(self, ch: int) -> "CurrentChannel":
         if ch < 0 or ch >= self.num_channels:
             raise ValueError(f"channel must be 0-{self.num_channels - 1}")
-        if ch not in self._channels:
-            self._channels[ch] = CurrentChannel(self._gm, self._board, self._dac, ch)
         return self._channels[ch]
 
     def set_span(self, span: CurrentSpan) -> None:
         """Set span for all channels."""
-        self._gm.command(f"{self._prefix()}:SPAN:ALL {int(span)}")
+        self._gm.command(f"{self._prefix()}:SPAN:ALL {_span_arg(span)}")
+
+    def set_codes(self, codes: dict[int, int]) -> None:
+        """Set raw DAC codes for several channels, keyed by channel index.
+
+        The writes are sent together as a single pipelined batch.
+        """
+        with self._gm.pipeline():
+            for ch, code in codes.items():
+                self.channel(ch).set_code(code)
+
+    def set_codes_and_update(self, codes: dict[int, int]) -> None:
+        """Like ``set_codes`` but also sends ``UPDATE`` in the same batch."""
+        with self._gm.pipeline():
+            self.set_codes(codes)
+            self.update()
 
     @property
     def resolution(self) -> int:
@@ -94,6 +142,17 @@ class CurrentDAC:
         """
         return self._gm.query(f"{self._prefix()}:FAULT?")
 
+    def fault_status_parsed(self) -> CurrentDACFault:
+        """Like ``fault_status`` but decoded into a ``CurrentDACFault``."""
+        resp = self.fault_status()
+        if not resp.startswith("FAULT:"):
+            return CurrentDACFault()
+        return CurrentDACFault(**{
+            _FAULT_FIELDS[name]: True
+            for name in resp[len("FAULT:"):].split(",")
+            if name in _FAULT_FIELDS
+        })
+
     def echo_readback(self) -> str:
         """Echo readback test (32-bit NOP).
 
@@ -112,21 +171,38 @@ class VoltageDAC:
         self._gm = gm
         self._board = board_id
         self._dac = dac_id
-        self._channels: dict[int, VoltageChannel] = {}
+        self._channels: list[VoltageChannel] = [
+            VoltageChannel(gm, board_id, dac_id, ch)
+            for ch in range(self.num_channels)
+        ]
+        self._prefix_str = f"BOARD{board_id}:DAC{dac_id}"
 
     def _prefix(self) -> str:
-        return f"BOARD{self._board}:DAC{self._dac}"
+        return self._prefix_str
 
     def channel(self, ch: int) -> "VoltageChannel":
         if ch < 0 or ch >= self.num_channels:
             raise ValueError(f"channel must be 0-{self.num_channels - 1}")
-        if ch not in self._channels:
-            self._channels[ch] = VoltageChannel(self._gm, self._board, self._dac, ch)
         return self._channels[ch]
 
     def set_span(self, span: VoltageSpan) -> None:
         """Set span for all channels."""
-        self._gm.command(f"{self._prefix()}:SPAN:ALL {int(span)}")
+        self._gm.command(f"{self._prefix()}:SPAN:ALL {_span_arg(span)}")
+
+    def set_codes(self, codes: dict[int, int]) -> None:
+        """Set raw DAC codes for several channels, keyed by channel index.
+
+        The writes are sent together as a single pipelined batch.
+        """
+        with self._gm.pipeline():
+            for ch, code in codes.items():
+                self.channel(ch).set_code(code)
+
+    def set_codes_and_update(self, codes: dict[int, int]) -> None:
+        """Like ``set_codes`` but also sends ``UPDATE`` in the same batch."""
+        with self._gm.pipeline():
+            self.set_codes(codes)
+            self.update()
 
     @property
     def resolution(self) -> int:
@@ -157,21 +233,27 @@ class CurrentChannel:
     def __init__(self, gm: GreyMatter, board_id: int, dac_id: int, ch: int):
         self._gm = gm
         self._prefix = f"BOARD{board_id}:DAC{dac_id}:CH{ch}"
+        # Command prefixes, built once for the hot setters
+        prefix = self._prefix.encode("ascii")
+        self._curr_prefix = prefix + b":CURR "
+        self._span_tmpl = self._prefix + ":SPAN "
+        self._code_prefix = prefix + b":CODE "
+        self._pdown_cmd = prefix + b":PDOWN"
 
     def set_current(self, milliamps: float) -> None:
         """Set output current in mA."""
-        self._gm.command(f"{self._prefix}:CURR {milliamps}")
+        self._gm.command_bytes(self._curr_prefix + str(milliamps).encode("ascii"))
 
     def set_span(self, span: CurrentSpan) -> None:
         """Set span for this channel."""
-        self._gm.command(f"{self._prefix}:SPAN {int(span)}")
+        self._gm.command(self._span_tmpl + _span_arg(span))
 
     def set_code(self, code: int) -> None:
         """Set raw DAC code."""
-        self._gm.command(f"{self._prefix}:CODE {code}")
+        self._gm.command_bytes(self._code_prefix + str(code).encode("ascii"))
 
     def power_down(self) -> None:
-        self._gm.command(f"{self._prefix}:PDOWN")
+        self._gm.command_bytes(self._pdown_cmd)
 
 
 class VoltageChannel:
@@ -180,18 +262,24 @@ class VoltageChannel:
     def __init__(self, gm: GreyMatter, board_id: int, dac_id: int, ch: int):
         self._gm = gm
         self._prefix = f"BOARD{board_id}:DAC{dac_id}:CH{ch}"
+        # Command prefixes, built once for the hot setters
+        prefix = self._prefix.encode("ascii")
+        self._volt_prefix = prefix + b":VOLT "
+        self._span_tmpl = self._prefix + ":SPAN "
+        self._code_prefix = prefix + b":CODE "
+        self._pdown_cmd = prefix + b":PDOWN"
 
     def set_voltage(self, volts: float) -> None:
         """Set output voltage in volts."""
-        self._gm.command(f"{self._prefix}:VOLT {volts}")
+        self._gm.command_bytes(self._volt_prefix + str(volts).encode("ascii"))
 
     def set_span(self, span: VoltageSpan) -> None:
         """Set span for this channel."""
-        self._gm.command(f"{self._prefix}:SPAN {int(span)}")
+        self._gm.command(self._span_tmpl + _span_arg(span))
 
     def set_code(self, code: int) -> None:
         """Set raw DAC code."""
-        self._gm.command(f"{self._prefix}:CODE {code}")
+        self._gm.command_bytes(self._code_prefix + str(code).encode("ascii"))
 
     def power_down(self) -> None:
-        self._gm.command(f"{self._prefix}:PDOWN")
+        self._gm.command_bytes(self._pdown_cmd)
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+
+from . import _json
+from .components import Board
 from .errors import GreyMatterError
-from .transport import SerialTransport, ZmqTransport, _CMD_TIMEOUT
+from .transport import (
+    SerialTransport, ThreadedSerialTransport, ZmqTransport, _CMD_TIMEOUT,
+)
+
+try:
+    import zmq
+except ImportError:
+    zmq = None
+
+_LIST_REQUEST = _json.dumps({"cmd": "__list__"})
 
 
 class GreyMatter:
@@ -26,6 +39,12 @@ class GreyMatter:
 
         with GreyMatter("/dev/tty.usbmodem1101") as gm:
             gm.board(0).dac(0).channel(0).set_current(50.0)
+
+    Batching many writes into one round-trip::
+
+        with gm.pipeline(commit=True):
+            for ch in range(5):
+                gm.board(0).dac(0).channel(ch).set_code(32768)
     """
 
     def __init__(
@@ -38,11 +57,17 @@ class GreyMatter:
         baudrate: int = 115200,
         num_boards: int = 8,
         timeout: float = _CMD_TIMEOUT,
+        background_reader: bool = False,
     ):
         self._num_boards = num_boards
 
         if port is not None:
-            self._transport = SerialTransport(port, baudrate, timeout)
+            if background_reader:
+                self._transport = ThreadedSerialTransport(
+                    port, baudrate, timeout
+                )
+            else:
+                self._transport = SerialTransport(port, baudrate, timeout)
         elif address is not None:
             self._transport = ZmqTransport(
                 address, pico, zmq_port, timeout=max(timeout, 10.0)
@@ -52,8 +77,17 @@ class GreyMatter:
                 "Provide 'port' for direct serial or 'address' for remote"
             )
 
-        # Lazily-constructed board cache
-        self._boards: dict[int, "Board"] = {}
+        # The topology is fixed, so build every Board/DAC/Channel up front
+        self._boards: list[Board] = [Board(self, b) for b in range(num_boards)]
+        self._channels_flat: tuple = tuple(
+            dac.channel(c)
+            for board in self._boards
+            for dac in map(board.dac, range(3))
+            for c in range(dac.num_channels)
+        )
+
+        # Commands queued by pipeline(); None when not batching
+        self._batch: list[str] | None = None
 
     # -- Context manager --
 
@@ -69,26 +103,16 @@ class GreyMatter:
 
     # -- Navigation --
 
-    def board(self, board_id: int) -> "Board":
+    def board(self, board_id: int) -> Board:
         """Return a Board object for the given board index (0-7)."""
         if board_id < 0 or board_id >= self._num_boards:
             raise ValueError(f"board_id must be 0-{self._num_boards - 1}")
-        if board_id not in self._boards:
-            from .components import Board
-            self._boards[board_id] = Board(self, board_id)
         return self._boards[board_id]
 
     @property
-    def channels(self) -> list:
-        """Flat list of all Channel objects across all boards."""
-        chs = []
-        for b in range(self._num_boards):
-            board = self.board(b)
-            for d in range(3):
-                dac = board.dac(d)
-                for c in range(dac.num_channels):
-                    chs.append(dac.channel(c))
-        return chs
+    def channels(self) -> tuple:
+        """Flat tuple of all Channel objects across all boards."""
+        return self._channels_flat
 
     # -- Global commands --
 
@@ -117,19 +141,82 @@ class GreyMatter:
     def command(self, cmd: str) -> str:
         """Send a SCPI command and return the response.
 
+        Inside a ``pipeline()`` block the command is queued instead and
+        an empty string is returned.
+
         Raises GreyMatterError if the firmware returns an ERROR: response.
         """
-        resp = self._transport.send_command(cmd)
-        if resp.startswith("ERROR:"):
-            raise GreyMatterError(resp)
+        if self._batch is not None:
+            self._batch.append(cmd)
+            return ""
+        return self._send(cmd)
+
+    def command_bytes(self, cmd: bytes) -> bytes:
+        """Like ``command`` but takes and returns ASCII bytes.
+
+        Lets hot paths that keep pre-encoded prefixes skip the per-call
+        encode of the command and decode of the response.
+        """
+        if self._batch is not None:
+            self._batch.append(cmd.decode("ascii"))
+            return b""
+        resp = self._transport.send_command_bytes(cmd)
+        if resp.startswith(b"ERROR:"):
+            raise GreyMatterError(resp.decode("ascii", errors="replace"))
         return resp
 
     def query(self, cmd: str) -> str:
         """Send a SCPI query and return the response string.
 
+        Inside a ``pipeline()`` block any queued commands are flushed
+        first, so the query sees their effect.
+
         Raises GreyMatterError if the firmware returns an ERROR: response.
         """
-        return self.command(cmd)
+        if self._batch:
+            self._flush_batch()
+        return self._send(cmd)
+
+    @contextmanager
+    def pipeline(self, commit: bool = False):
+        """Queue commands and send them together in a single round-trip.
+
+        Commands issued inside the block are buffered and written as one
+        newline-separated payload when the block exits. Errors reported
+        by the firmware are raised on exit. If the block raises, the
+        queued commands are discarded. Nested blocks join the outer one.
+
+        With ``commit=True``, ``UPDATE:ALL`` is appended as the last
+        command of the block so the outputs update in the same trip.
+        """
+        if self._batch is not None:
+            yield self
+            if commit:
+                self.update_all()
+            return
+        self._batch = []
+        try:
+            yield self
+            if commit:
+                self.update_all()
+            self._flush_batch()
+        finally:
+            self._batch = None
+
+    def _flush_batch(self) -> None:
+        cmds, self._batch = self._batch, []
+        if not cmds:
+            return
+        resps = self._transport.send_commands(cmds)
+        for cmd, resp in zip(cmds, resps):
+            if resp.startswith("ERROR:"):
+                raise GreyMatterError(f"{resp} (from {cmd!r})")
+
+    def _send(self, cmd: str) -> str:
+        resp = self._transport.send_command(cmd)
+        if resp.startswith("ERROR:"):
+            raise GreyMatterError(resp)
+        return resp
 
     # -- Server utilities --
 
@@ -139,7 +226,8 @@ class GreyMatter:
     ) -> list[dict]:
         """Query the server for a list of connected Pico boards.
 
-        Returns a list of dicts with keys: name, port, idn.
+        Returns a list of dicts with keys: name, port, idn, and pending
+        (requests queued for that board's serial worker).
 
         Example::
 
@@ -147,20 +235,66 @@ class GreyMatter:
             for p in picos:
                 print(f"{p['name']} on {p['port']}: {p['idn']}")
         """
-        import json
-        import zmq
-
-        context = zmq.Context()
-        socket = context.socket(zmq.REQ)
-        socket.setsockopt(zmq.RCVTIMEO, int(timeout * 1000))
-        socket.setsockopt(zmq.LINGER, 1000)
-        socket.connect(f"tcp://{address}:{zmq_port}")
+        lister = _PicoLister(address, zmq_port, timeout)
         try:
-            socket.send_string(json.dumps({"cmd": "__list__"}))
-            reply = json.loads(socket.recv_string())
-            if reply.get("ok"):
-                return reply["data"]
-            raise GreyMatterError(reply.get("error", "Unknown error"))
+            return lister()
         finally:
-            socket.close()
-            context.destroy()
+            lister.close()
+
+    @staticmethod
+    def list_picos_persistent(
+        address: str, zmq_port: int = 5556, timeout: float = 5.0
+    ) -> "_PicoLister":
+        """Return a callable that lists the server's Picos on each call.
+
+        Keeps its socket open between calls, which suits polling for
+        boards being plugged in. Call ``.close()`` on it when done.
+
+        Example::
+
+            lister = GreyMatter.list_picos_persistent("192.168.1.100")
+            while not lister():
+                time.sleep(1)
+            lister.close()
+        """
+        return _PicoLister(address, zmq_port, timeout)
+
+
+class _PicoLister:
+    """Sends ``__list__`` to a server over a reusable REQ socket.
+
+    Uses the process-wide ZMQ context, so repeated listing doesn't pay
+    for context setup and teardown.
+    """
+
+    def __init__(self, address: str, zmq_port: int, timeout: float):
+        if zmq is None:
+            raise ImportError(
+                "Listing Picos requires pyzmq (pip install greymatter[server])"
+            )
+        self._endpoint = f"tcp://{address}:{zmq_port}"
+        self._timeout = timeout
+        self._socket = self._connect()
+
+    def __call__(self) -> list[dict]:
+        try:
+            self._socket.send(_LIST_REQUEST)
+            reply = _json.loads(self._socket.recv())
+        except zmq.Again:
+            # A REQ socket can't send again until it gets a reply; start over
+            self._socket.close()
+            self._socket = self._connect()
+            raise GreyMatterError("Server timeout")
+        if reply.get("ok"):
+            return reply["data"]
+        raise GreyMatterError(reply.get("error", "Unknown error"))
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def _connect(self):
+        socket = zmq.Context.instance().socket(zmq.REQ)
+        socket.setsockopt(zmq.RCVTIMEO, int(self._timeout * 1000))
+        socket.setsockopt(zmq.LINGER, 1000)
+        socket.connect(self._endpoint)
+        return socket
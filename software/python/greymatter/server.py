@@ -11,7 +11,8 @@ Usage::
 
 The server auto-discovers Pico boards by scanning serial ports and
 sending ``*IDN?``.  Each board is assigned a name (``pico_0``, ``pico_1``,
-etc.) in the order they are discovered.
+etc.) in the order they are discovered.  Each board is served by its
+own worker thread, so requests to different boards run concurrently.
 
 Clients connect with::
 
@@ -21,13 +22,26 @@ Clients connect with::
 from __future__ import annotations
 
 import argparse
-import json
 import glob as glob_module
+import os
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import zmq
+
+from . import _json
 from .transport import SerialTransport
 from .errors import GreyMatterError
 
+# Reply to an unparseable request, which has no id to echo
+_INVALID_JSON = _json.dumps({"ok": False, "error": "Invalid JSON"})
+
+
+# Wildcard characters that need a real glob
+_MAGIC = frozenset("*?[")
+
 
 def _log(msg: str) -> None:
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}", flush=True)
@@ -36,12 +50,36 @@ def _log(msg: str) -> None:
 class PicoConnection:
     """Tracks a single Pico board connection."""
 
-    def __init__(self, name: str, port: str, transport: SerialTransport,
-                 idn: str):
+    __slots__ = ("name", "port", "transport", "idn", "baudrate", "timeout",
+                 "pending")
+
+    def __init__(self, name: str, port: str,
+                 transport: SerialTransport | None, idn: str,
+                 baudrate: int = 115200, timeout: float = 2.0):
         self.name = name
         self.port = port
+        # None while the port is closed after a failed reopen
         self.transport = transport
         self.idn = idn
+        self.baudrate = baudrate
+        self.timeout = timeout
+        # Requests handed to the worker and not yet answered
+        self.pending = 0
+
+    def reopen(self) -> None:
+        """Close the serial port and open it again, e.g. after a reset.
+
+        If the port can't be opened, ``transport`` is left as ``None`` and
+        the error propagates; the next request or link check retries.
+        """
+        old, self.transport = self.transport, None
+        if old is not None:
+            try:
+                old.close()
+            except Exception:
+                pass
+        self.transport = SerialTransport(self.port, self.baudrate,
+                                         self.timeout, single_owner=True)
 
 
 def discover_picos(
@@ -51,6 +89,9 @@ def discover_picos(
 ) -> dict[str, PicoConnection]:
     """Scan serial ports for greymatter Pico boards.
 
+    Ports are probed in parallel, since each probe mostly waits on serial
+    timeouts; names are still assigned in scan order.
+
     Returns:
         dict mapping name -> PicoConnection for each board that responds
         to ``*IDN?``.
@@ -58,66 +99,324 @@ def discover_picos(
     if patterns is None:
         patterns = ["/dev/ttyACM*", "/dev/ttyUSB*", "/dev/tty.usbmodem*"]
 
-    ports: list[str] = []
-    for pattern in patterns:
-        ports.extend(sorted(glob_module.glob(pattern)))
+    # A port matched by two patterns must only be opened once
+    ports = list(dict.fromkeys(_find_ports(patterns)))
+
+    with ThreadPoolExecutor(max_workers=len(ports) or 1) as pool:
+        probes = [
+            pool.submit(_probe_port, port, baudrate, timeout)
+            for port in ports
+        ]
 
     picos: dict[str, PicoConnection] = {}
-    idx = 0
-    for port in ports:
+    for port, probe in zip(ports, probes):
         try:
-            _log(f"Trying {port} ...")
-            transport = SerialTransport(port, baudrate, timeout)
-            idn = transport.send_command("*IDN?")
-            name = f"pico_{idx}"
-            picos[name] = PicoConnection(name, port, transport, idn)
-            _log(f"  -> {name}: {idn}")
-            idx += 1
+            transport, idn = probe.result()
         except Exception as exc:
-            _log(f"  -> skip: {exc}")
+            _log(f"  {port} -> skip: {exc}")
+            continue
+        name = f"pico_{len(picos)}"
+        picos[name] = PicoConnection(name, port, transport, idn,
+                                     baudrate, timeout)
+        _log(f"  {port} -> {name}: {idn}")
 
     return picos
 
 
+def _find_ports(patterns: list[str]) -> list[str]:
+    """Expand port patterns, in pattern order and sorted within each.
+
+    Patterns of the form ``<dir>/<prefix>*``, which covers the defaults,
+    share one ``os.scandir`` per directory instead of each globbing it.
+    """
+    listings: dict[str, list[str]] = {}
+    ports: list[str] = []
+    for pattern in patterns:
+        directory, name = os.path.split(pattern)
+        prefix = name[:-1]
+        if (not name.endswith("*") or not prefix
+                or not _MAGIC.isdisjoint(prefix)
+                or not _MAGIC.isdisjoint(directory)):
+            ports.extend(sorted(glob_module.glob(pattern)))
+            continue
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = [e.name for e in entries]
+            except OSError:
+                listings[directory] = []
+        ports.extend(sorted(
+            os.path.join(directory, n)
+            for n in listings[directory] if n.startswith(prefix)
+        ))
+    return ports
+
+
+def _probe_port(port: str, baudrate: int,
+                timeout: float) -> tuple[SerialTransport, str]:
+    """Open *port* and ask it to identify itself."""
+    _log(f"Trying {port} ...")
+    # Used by one thread at a time: the prober, then the Pico's worker
+    transport = SerialTransport(port, baudrate, timeout, single_owner=True)
+    try:
+        return transport, transport.send_command("*IDN?")
+    except Exception:
+        transport.close()
+        raise
+
+
+# In-process endpoint connecting the router thread to the Pico workers
+_WORKER_ENDPOINT = "inproc://greymatter-workers"
+
+# In-process endpoint the signal handlers use to stop the router thread
+_CONTROL_ENDPOINT = "inproc://greymatter-control"
+
+# How long a worker sits idle before it checks its serial link (ms)
+_LINK_CHECK_INTERVAL_MS = 30_000
+
+
+class _WorkerPool:
+    """One thread per Pico, each owning that Pico's serial transport.
+
+    Workers are DEALER sockets whose identity is the Pico name, so the
+    router thread addresses a request to a Pico by prefixing its name.
+    Requests to different Picos therefore run in parallel, while each
+    Pico still sees its commands one at a time and in order.
+
+    A worker announces itself and its exit with an empty frame, which
+    the backend ROUTER sees as ``[name, b""]``; replies always carry a
+    client envelope and so have more frames.
+    """
+
+    def __init__(self, context, frontend, backend,
+                 cpus: set[int] | None = None):
+        self._context = context
+        self._frontend = frontend
+        self._backend = backend
+        self._cpus = cpus
+        self._threads: list = []
+
+    def start(self, picos: dict[str, PicoConnection]) -> None:
+        for pico in picos.values():
+            thread = threading.Thread(
+                target=_pico_worker, args=(pico, self._context, self._cpus),
+                name=f"worker-{pico.name}", daemon=True,
+            )
+            thread.start()
+            self._threads.append((pico.name, thread))
+        # Wait for every worker to connect; the ROUTER would otherwise
+        # drop messages addressed to it.
+        for _ in self._threads:
+            self._backend.recv_multipart()
+
+    def stop(self) -> None:
+        # Queued behind any pending requests, so those finish first
+        for name, _ in self._threads:
+            self._backend.send_multipart([name.encode(), b""])
+        remaining = len(self._threads)
+        while remaining:
+            frames = self._backend.recv_multipart()
+            if len(frames) == 2 and not frames[1]:
+                remaining -= 1
+            else:
+                self._frontend.send_multipart(frames[1:])
+        for _, thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+
+def _pico_worker(pico: PicoConnection, context,
+                 cpus: set[int] | None = None) -> None:
+    """Serve requests for one Pico until told to stop.
+
+    When no request arrives for a while the worker checks the serial
+    link, so a board that was unplugged or reset is reopened before the
+    next client needs it.
+    """
+    if cpus:
+        try:
+            # Pid 0 is the calling thread
+            os.sched_setaffinity(0, cpus)
+        except (AttributeError, OSError) as exc:
+            _log(f"[{pico.name}] can't pin to CPUs {sorted(cpus)}: {exc}")
+
+    sock = context.socket(zmq.DEALER)
+    sock.setsockopt(zmq.IDENTITY, pico.name.encode())
+    sock.connect(_WORKER_ENDPOINT)
+    try:
+        sock.send(b"")
+        while True:
+            if not sock.poll(_LINK_CHECK_INTERVAL_MS):
+                _check_link(pico)
+                continue
+            frames = sock.recv_multipart(copy=False)
+            if len(frames) == 1:
+                sock.send(b"")
+                return
+            # [client envelope..., request]; the envelope goes back as is
+            request = _json.loads(frames[-1].buffer)
+            reply = _execute(pico, request)
+            if "id" in request:
+                reply["id"] = request["id"]
+            frames[-1] = _json.dumps(reply)
+            sock.send_multipart(frames)
+    finally:
+        sock.close()
+
+
+def _check_link(pico: PicoConnection) -> None:
+    """Ping an idle Pico and reopen its port if it doesn't answer."""
+    if pico.transport is None:
+        _log(f"[{pico.name}] not connected; reopening {pico.port}")
+    else:
+        try:
+            pico.transport.send_command("*IDN?")
+            return
+        except Exception as exc:
+            _log(f"[{pico.name}] link check failed: {exc}; "
+                 f"reopening {pico.port}")
+    try:
+        pico.reopen()
+    except Exception as exc:
+        _log(f"[{pico.name}] reopen failed: {exc}")
+
+
+def _install_signal_handlers(context):
+    """Turn SIGINT and SIGTERM into a message on the control socket.
+
+    Returns a callable that restores the previous handlers.  Handlers
+    can only be installed from the main thread; elsewhere this does
+    nothing.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+
+    notify = context.socket(zmq.PUSH)
+    notify.connect(_CONTROL_ENDPOINT)
+
+    def handler(signum, frame):
+        try:
+            notify.send(b"", zmq.NOBLOCK)
+        except zmq.Again:
+            pass  # Shutdown already requested
+
+    previous = {
+        sig: signal.signal(sig, handler)
+        for sig in (signal.SIGINT, signal.SIGTERM)
+    }
+
+    def restore():
+        for sig, prev in previous.items():
+            signal.signal(sig, prev)
+        notify.close()
+
+    return restore
+
+
 def _handle_meta(cmd: str, picos: dict[str, PicoConnection],
-                 scan_kw: dict) -> str:
+                 scan_kw: dict, workers: _WorkerPool) -> dict:
     """Handle server meta-commands (prefixed with ``__``)."""
     if cmd == "__list__":
         info = [
-            {"name": p.name, "port": p.port, "idn": p.idn}
+            {"name": p.name, "port": p.port, "idn": p.idn,
+             "pending": p.pending}
             for p in picos.values()
         ]
-        return json.dumps({"ok": True, "data": info})
+        return {"ok": True, "data": info}
 
     if cmd == "__rescan__":
+        workers.stop()
         for p in picos.values():
+            if p.transport is None:
+                continue
             try:
                 p.transport.close()
             except Exception:
                 pass
         picos.clear()
         picos.update(discover_picos(**scan_kw))
-        return json.dumps(
-            {"ok": True, "data": f"Found {len(picos)} pico(s)"}
+        workers.start(picos)
+        return {"ok": True, "data": f"Found {len(picos)} pico(s)"}
+
+    return {"ok": False, "error": f"Unknown meta command: {cmd}"}
+
+
+def _resolve_pico(pico_name: str | None,
+                  picos: dict[str, PicoConnection]) -> PicoConnection:
+    """Return the Pico a request is addressed to.
+
+    Raises GreyMatterError if it can't be determined.
+    """
+    if pico_name is None:
+        if len(picos) == 1:
+            return next(iter(picos.values()))
+        if len(picos) == 0:
+            raise GreyMatterError("No Pico boards connected")
+        raise GreyMatterError(
+            f"Multiple picos connected, specify one of: {list(picos.keys())}"
+        )
+    pico = picos.get(pico_name)
+    if pico is None:
+        raise GreyMatterError(
+            f"Unknown pico '{pico_name}'. Available: {list(picos.keys())}"
         )
+    return pico
 
-    return json.dumps({"ok": False, "error": f"Unknown meta command: {cmd}"})
+
+def _execute(pico: PicoConnection, request: dict) -> dict:
+    """Forward a request to a Pico and return the reply dict.
+
+    A request carries either a single ``"cmd"`` or a list of ``"cmds"``;
+    a batch is pipelined over the serial link and answered with the list
+    of responses.  If the port was lost, it is reopened first.
+    """
+    if pico.transport is None:
+        try:
+            pico.reopen()
+        except Exception as exc:
+            _log(f"[{pico.name}] reopen failed: {exc}")
+            return {"ok": False, "error": f"{pico.name} not connected"}
+    try:
+        cmds = request.get("cmds")
+        if cmds is None:
+            cmd = request.get("cmd", "")
+            _log(f"[{pico.name}] {cmd}")
+            result = pico.transport.send_command(cmd)
+        else:
+            _log(f"[{pico.name}] batch of {len(cmds)} command(s)")
+            result = pico.transport.send_commands(cmds)
+        return {"ok": True, "data": result}
+    except GreyMatterError as exc:
+        _log(f"[{pico.name}] ERROR: {exc}")
+        return {"ok": False, "error": str(exc)}
+    except Exception as exc:
+        _log(f"[{pico.name}] COMM ERROR: {exc}")
+        return {"ok": False, "error": f"Communication error: {exc}"}
 
 
 def run_server(
     port: int = 5556,
     scan_patterns: list[str] | None = None,
     baudrate: int = 115200,
+    worker_cpus: set[int] | None = None,
 ) -> None:
     """Start the ZMQ server loop.
 
+    A ROUTER socket accepts client requests. Meta commands are answered
+    directly; SCPI commands are handed to the worker thread of the
+    target Pico, and its reply is routed back to the client.  SIGINT
+    and SIGTERM stop the loop cleanly once in-flight requests finish.
+
     Args:
-        port: TCP port for the ZMQ REP socket.
+        port: TCP port for the ZMQ ROUTER socket.
         scan_patterns: Glob patterns for serial port discovery.
         baudrate: Baud rate for Pico serial connections.
+        worker_cpus: CPUs to pin the serial worker threads to (Linux
+            only). Keeps them from being migrated away from the core
+            servicing USB interrupts; works best with those CPUs kept
+            free of other tasks via the ``isolcpus=`` kernel parameter
+            (on a Raspberry Pi, in ``/boot/firmware/cmdline.txt``).
     """
-    import zmq
-
     _log("Starting greymatter server")
 
     scan_kw = {"patterns": scan_patterns, "baudrate": baudrate}
@@ -130,89 +429,96 @@ def run_server(
     _log(f"Managing {len(picos)} Pico board(s)")
 
     context = zmq.Context()
-    socket = context.socket(zmq.REP)
-    socket.bind(f"tcp://*:{port}")
+    frontend = context.socket(zmq.ROUTER)
+    # Notice clients that vanish without closing, and don't let replies
+    # to them hold up shutdown (libzmq already disables Nagle)
+    frontend.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    frontend.setsockopt(zmq.LINGER, 1000)
+    # Clients reconnecting with their fixed identity take over the old route
+    frontend.setsockopt(zmq.ROUTER_HANDOVER, 1)
+    frontend.bind(f"tcp://*:{port}")
+    backend = context.socket(zmq.ROUTER)
+    # Workers restarted by __rescan__ reuse their Pico's name
+    backend.setsockopt(zmq.ROUTER_HANDOVER, 1)
+    backend.bind(_WORKER_ENDPOINT)
+    control = context.socket(zmq.PULL)
+    control.bind(_CONTROL_ENDPOINT)
+
+    workers = _WorkerPool(context, frontend, backend, worker_cpus)
+    workers.start(picos)
     _log(f"Listening on tcp://*:{port}")
 
+    poller = zmq.Poller()
+    poller.register(frontend, zmq.POLLIN)
+    poller.register(backend, zmq.POLLIN)
+    poller.register(control, zmq.POLLIN)
+    restore_signals = _install_signal_handlers(context)
+
     try:
         while True:
-            raw = socket.recv_string()
+            events = dict(poller.poll())
+
+            if control in events:
+                _log("Shutting down")
+                break
+
+            # Frames are received without copying: apart from the request
+            # body, the router only forwards them.
+
+            # Worker replies: [worker, client envelope..., reply]
+            if backend in events:
+                frames = backend.recv_multipart(copy=False)
+                pico = picos.get(frames[0].bytes.decode())
+                if pico is not None:
+                    pico.pending -= 1
+                frontend.send_multipart(frames[1:])
+
+            if frontend not in events:
+                continue
+            # Client requests: [client envelope..., request]
+            frames = frontend.recv_multipart(copy=False)
+            envelope, raw = frames[:-1], frames[-1]
 
             # Parse request
             try:
-                request = json.loads(raw)
-            except json.JSONDecodeError:
-                socket.send_string(
-                    json.dumps({"ok": False, "error": "Invalid JSON"})
-                )
+                request = _json.loads(raw.buffer)
+            except ValueError:
+                frontend.send_multipart([*envelope, _INVALID_JSON])
                 continue
 
             cmd = request.get("cmd", "")
-            pico_name = request.get("pico")
 
             # Meta commands
             if cmd.startswith("__") and cmd.endswith("__"):
-                reply = _handle_meta(cmd, picos, scan_kw)
-                socket.send_string(reply)
-                continue
-
-            # Resolve which Pico to route to
-            if pico_name is None:
-                if len(picos) == 1:
-                    pico = next(iter(picos.values()))
-                elif len(picos) == 0:
-                    socket.send_string(json.dumps({
-                        "ok": False,
-                        "error": "No Pico boards connected"
-                    }))
-                    continue
-                else:
-                    socket.send_string(json.dumps({
-                        "ok": False,
-                        "error": (
-                            f"Multiple picos connected, specify one of: "
-                            f"{list(picos.keys())}"
-                        ),
-                    }))
-                    continue
+                reply = _handle_meta(cmd, picos, scan_kw, workers)
             else:
-                pico = picos.get(pico_name)
-                if pico is None:
-                    socket.send_string(json.dumps({
-                        "ok": False,
-                        "error": (
-                            f"Unknown pico '{pico_name}'. "
-                            f"Available: {list(picos.keys())}"
-                        ),
-                    }))
+                try:
+                    pico = _resolve_pico(request.get("pico"), picos)
+                except GreyMatterError as exc:
+                    reply = {"ok": False, "error": str(exc)}
+                else:
+                    backend.send_multipart([pico.name.encode(), *frames])
+                    pico.pending += 1
                     continue
 
-            # Forward SCPI command to the Pico
-            try:
-                _log(f"[{pico.name}] {cmd}")
-                result = pico.transport.send_command(cmd)
-                socket.send_string(json.dumps({"ok": True, "data": result}))
-            except GreyMatterError as exc:
-                _log(f"[{pico.name}] ERROR: {exc}")
-                socket.send_string(
-                    json.dumps({"ok": False, "error": str(exc)})
-                )
-            except Exception as exc:
-                _log(f"[{pico.name}] COMM ERROR: {exc}")
-                socket.send_string(json.dumps({
-                    "ok": False,
-                    "error": f"Communication error: {exc}",
-                }))
-
-    except KeyboardInterrupt:
-        _log("Shutting down")
+            # Echo the correlation id so pipelining clients can match replies
+            if "id" in request:
+                reply["id"] = request["id"]
+            frontend.send_multipart([*envelope, _json.dumps(reply)])
+
     finally:
+        restore_signals()
+        workers.stop()
         for p in picos.values():
+            if p.transport is None:
+                continue
             try:
                 p.transport.close()
             except Exception:
                 pass
-        socket.close()
+        frontend.close()
+        backend.close()
+        control.close()
         context.destroy()
 
 
@@ -233,8 +539,16 @@ def main() -> None:
         "--baudrate", type=int, default=115200,
         help="Serial baud rate (default: 115200)",
     )
+    parser.add_argument(
+        "--worker-cpus", nargs="+", type=int, metavar="CPU",
+        help="Pin the serial worker threads to these CPUs (Linux only; "
+             "pair with the isolcpus= kernel parameter)",
+    )
     args = parser.parse_args()
-    run_server(port=args.port, scan_patterns=args.scan, baudrate=args.baudrate)
+    run_server(
+        port=args.port, scan_patterns=args.scan, baudrate=args.baudrate,
+        worker_cpus=set(args.worker_cpus) if args.worker_cpus else None,
+    )
 
 
 if __name__ == "__main__":
@@ -1,19 +1,63 @@
 from __future__ import annotations
 
+import itertools
+import os
+import select
 import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import nullcontext
+from functools import lru_cache
 
+from . import _json
 from .errors import GreyMatterError
 
+try:
+    import serial
+except ImportError:
+    serial = None
+
+try:
+    import zmq
+except ImportError:
+    zmq = None
+
 # Sentinel bytes for detecting the firmware prompt
 _PROMPT = b"> "
 
+# Tail of a response whose body is just "OK" (the reply to every setter)
+_OK_TAIL = b"\r\nOK\r\n" + _PROMPT
+
 # How long to wait for the startup banner to finish (seconds)
 _CONNECT_TIMEOUT = 5.0
 
 # Per-command timeout (seconds)
 _CMD_TIMEOUT = 2.0
 
+# Bytes requested per os.read() on the serial file descriptor
+_READ_CHUNK = 4096
+
+# How long the line must stay silent before a resync considers it clear
+_RESYNC_QUIET = 0.05
+
+# How long to busy-poll for the start of a response before blocking
+# (seconds). Bounded so slow commands don't burn a core.
+_SPIN_TIME = 200e-6
+
+
+def _decode(body: bytes) -> str:
+    return body.decode("ascii", errors="replace")
+
+
+@lru_cache(maxsize=256)
+def _encode_line(cmd: str) -> bytes:
+    """Encode a command for the wire; repeated queries hit the cache."""
+    return (cmd + "\n").encode("ascii")
+
 
 class Transport(ABC):
     """Abstract transport for sending SCPI commands to a greymatter board."""
@@ -27,6 +71,20 @@ class Transport(ABC):
         """
         ...
 
+    def send_command_bytes(self, cmd: bytes) -> bytes:
+        """Like ``send_command`` but takes and returns ASCII bytes."""
+        return self.send_command(cmd.decode("ascii")).encode(
+            "ascii", errors="replace"
+        )
+
+    def send_commands(self, cmds: list[str]) -> list[str]:
+        """Send several SCPI commands and return their response bodies.
+
+        The default implementation sends them one at a time; transports
+        that can pipeline should override this to save round-trips.
+        """
+        return [self.send_command(cmd) for cmd in cmds]
+
     @abstractmethod
     def close(self) -> None:
         """Release the underlying connection."""
@@ -38,101 +96,639 @@ class SerialTransport(Transport):
 
     Handles the firmware's serial protocol: echo, ``\\r\\n`` delimiters,
     and the ``> `` prompt.
+
+    Where the port exposes a file descriptor (POSIX), commands and
+    responses go straight through ``os.write``/``os.read`` on it rather
+    than through pyserial's per-call bookkeeping.
+
+    Pass ``single_owner=True`` when only one thread will ever use the
+    transport; commands then skip taking the lock.
     """
 
     def __init__(self, port: str, baudrate: int = 115200,
-                 timeout: float = _CMD_TIMEOUT):
-        import serial
-        self._lock = threading.Lock()
+                 timeout: float = _CMD_TIMEOUT, *,
+                 single_owner: bool = False):
+        if serial is None:
+            raise ImportError("Serial connections require pyserial")
+        self._lock = nullcontext() if single_owner else threading.Lock()
         self._ser = serial.Serial(port, baudrate, timeout=timeout)
+        try:
+            self._fd: int | None = self._ser.fileno()
+        except (AttributeError, OSError):
+            self._fd = None
+        # Bytes read past the last prompt
+        self._rxbuf = bytearray()
+        # Responses still owed by the board after a failed exchange
+        self._unanswered = 0
+
         self._drain_until_prompt(_CONNECT_TIMEOUT)
+        self._ser.reset_input_buffer()
+        self._rxbuf.clear()
 
     def send_command(self, cmd: str) -> str:
+        return _decode(self._send_line(_encode_line(cmd)))
+
+    def send_command_bytes(self, cmd: bytes) -> bytes:
+        return self._send_line(cmd + b"\n")
+
+    def _send_line(self, line: bytes) -> bytes:
         with self._lock:
-            self._ser.reset_input_buffer()
-            self._ser.write((cmd + "\n").encode("ascii"))
+            self._check_open()
+            if self._unanswered:
+                self._resync()
+            try:
+                self._write(line)
+                return self._read_response()
+            except BaseException:
+                # The response may still be on its way
+                self._unanswered = 1
+                raise
 
-            buf = b""
-            while True:
-                byte = self._ser.read(1)
-                if not byte:
-                    raise GreyMatterError("Timeout waiting for response")
-                buf += byte
-                if buf.endswith(_PROMPT):
-                    break
+    def send_commands(self, cmds: list[str]) -> list[str]:
+        """Write all commands in one go, then collect one response each.
 
-            # Buffer contains "ECHO\r\nRESPONSE\r\n> "
-            text = buf.decode("ascii", errors="replace")
-            text = text[: -len("> ")]
+        The firmware processes input line by line, so the responses come
+        back in order, each terminated by its own prompt.
+        """
+        if not cmds:
+            return []
+        # Encode up front: a bad command must not count as sent
+        payload = ("\n".join(cmds) + "\n").encode("ascii")
+        with self._lock:
+            self._check_open()
+            if self._unanswered:
+                self._resync()
+            responses: list[str] = []
+            try:
+                self._write(payload)
+                for _ in cmds:
+                    responses.append(_decode(self._read_response()))
+                return responses
+            except BaseException:
+                self._unanswered = len(cmds) - len(responses)
+                raise
+
+    def _read_response(self) -> bytes:
+        """Read one response up to the prompt and strip the echo."""
+        body = self._read_until_prompt()
+        if body is None:
+            raise GreyMatterError("Timeout waiting for response")
+        return body
 
-            lines = text.split("\r\n")
-            while lines and lines[-1] == "":
-                lines.pop()
+    @staticmethod
+    def _parse_response(buf: bytes | bytearray, end: int) -> bytes:
+        """Return the body of the response that ends at ``buf[end]``.
 
-            # First line is the echo; the rest is the response
-            if len(lines) <= 1:
-                return ""
-            return "\r\n".join(lines[1:])
+        Only the body is copied out, so a large response isn't first
+        copied whole.
+        """
+        if buf.endswith(_OK_TAIL, 0, end):
+            return b"OK"
+        # Buffer contains "ECHO\r\nRESPONSE\r\n> "; slice out RESPONSE
+        end -= len(_PROMPT)
+        if buf.endswith(b"\r\n", 0, end):
+            end -= 2
+        echo_end = buf.find(b"\r\n", 0, end)
+        if echo_end < 0:
+            return b""
+        return bytes(buf[echo_end + 2:end])
+
+    def resync(self) -> None:
+        """Discard any stale input so the next command starts clean.
+
+        The protocol is strictly request/response, so this is only needed
+        after an error left a late or partial response on the line.
+        """
+        with self._lock:
+            self._check_open()
+            self._resync()
 
     def close(self) -> None:
-        if self._ser and self._ser.is_open:
-            self._ser.close()
+        with self._lock:
+            # The fd number may be reused by the next file the process opens
+            self._fd = None
+            if self._ser and self._ser.is_open:
+                self._ser.close()
+
+    def _check_open(self) -> None:
+        if not self._ser.is_open:
+            raise GreyMatterError("Transport is closed")
+
+    def _resync(self) -> None:
+        """Throw away what is left of an interrupted exchange.
+
+        Responses that timed out may still be on their way, so first wait
+        for the prompts still owed (the board answers every line), then
+        flush until the line goes quiet.
+        """
+        # A slow command can outlast a short port timeout
+        timeout = max(self._ser.timeout or 0.0, _CMD_TIMEOUT)
+        for _ in range(self._unanswered):
+            try:
+                if not self._drain_until_prompt(timeout):
+                    break
+            except GreyMatterError:
+                break
+        self._unanswered = 0
+        self._rxbuf.clear()
+        deadline = time.monotonic() + _CMD_TIMEOUT
+        while True:
+            self._ser.reset_input_buffer()
+            if (time.monotonic() >= deadline
+                    or not self._input_pending(_RESYNC_QUIET)):
+                break
+
+    def _input_pending(self, timeout: float) -> bool:
+        """Wait up to *timeout* for input to arrive."""
+        if self._fd is not None:
+            return bool(select.select([self._fd], [], [], timeout)[0])
+        time.sleep(timeout)
+        return self._ser.in_waiting > 0
+
+    def _write(self, data: bytes) -> None:
+        if self._fd is None:
+            self._ser.write(data)
+            return
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(self._fd, view):]
+                continue
+            except BlockingIOError:
+                pass
+            # Output buffer is full. Keep reading while we wait, otherwise
+            # a long pipelined batch can stall on its own unread responses.
+            readable, writable, _ = select.select(
+                [self._fd], [self._fd], [], self._ser.timeout
+            )
+            if not readable and not writable:
+                raise GreyMatterError("Timeout writing command")
+            if readable:
+                self._read_chunk()
+
+    def _read_chunk(self) -> None:
+        """Append whatever is waiting on the fd to the receive buffer."""
+        try:
+            chunk = os.read(self._fd, _READ_CHUNK)
+        except BlockingIOError:
+            return
+        if not chunk:
+            raise GreyMatterError("Serial device disconnected")
+        self._rxbuf += chunk
+
+    def _spin_until_readable(self) -> bool:
+        spin_end = time.perf_counter() + _SPIN_TIME
+        while not select.select([self._fd], [], [], 0)[0]:
+            if time.perf_counter() >= spin_end:
+                return False
+        return True
+
+    def _read_until_prompt(self) -> bytes | None:
+        """Consume the next response and return its body.
 
-    def _drain_until_prompt(self, timeout: float) -> None:
-        """Read and discard bytes until the '> ' prompt is seen."""
+        Returns None if the prompt does not arrive within the port timeout.
+        """
+        if self._fd is None:
+            return self._read_until_prompt_portable()
+
+        buf = self._rxbuf
+        timeout = self._ser.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        spin = True
+        while True:
+            body = self._take_response(start)
+            if body is not None:
+                return body
+            # The prompt may straddle the next chunk boundary
+            start = max(len(buf) - len(_PROMPT) + 1, 0)
+
+            # Fast replies arrive within microseconds; catch them without
+            # paying for a blocking select() wakeup.
+            if spin:
+                spin = False
+                if self._spin_until_readable():
+                    self._read_chunk()
+                    continue
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return None
+            self._read_chunk()
+
+    def _read_until_prompt_portable(self) -> bytes | None:
+        """``_read_until_prompt`` for ports without a file descriptor.
+
+        Reads whatever pyserial has buffered in one call rather than
+        going through ``read_until``, which fetches a byte at a time.
+        """
+        buf = self._rxbuf
+        timeout = self._ser.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while True:
+            body = self._take_response(start)
+            if body is not None:
+                return body
+            start = max(len(buf) - len(_PROMPT) + 1, 0)
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            # Blocks for up to the port timeout when nothing is waiting
+            chunk = self._ser.read(self._ser.in_waiting or 1)
+            if not chunk:
+                return None
+            buf += chunk
+
+    def _take_response(self, start: int) -> bytes | None:
+        """Pop the response ending at the first prompt at or after *start*.
+
+        Returns its body, or None if no complete response is buffered.
+        """
+        buf = self._rxbuf
+        idx = buf.find(_PROMPT, start)
+        if idx < 0:
+            return None
+        end = idx + len(_PROMPT)
+        body = self._parse_response(buf, end)
+        del buf[:end]
+        return body
+
+    def _drain_until_prompt(self, timeout: float) -> bool:
+        """Read and discard bytes until the '> ' prompt is seen.
+
+        Returns False if it did not arrive within *timeout*.
+        """
         old_timeout = self._ser.timeout
         self._ser.timeout = timeout
-        buf = b""
         try:
-            while True:
-                byte = self._ser.read(1)
-                if not byte:
-                    break
-                buf += byte
-                if buf.endswith(_PROMPT):
-                    break
+            return self._read_until_prompt() is not None
         finally:
             self._ser.timeout = old_timeout
 
 
+class ThreadedSerialTransport(SerialTransport):
+    """Serial transport with a background reader thread.
+
+    Commands are written from the calling thread, while a reader thread
+    scans the incoming stream for prompts and hands each response to the
+    oldest outstanding command. Several commands, from one thread via
+    ``submit()`` or from many threads at once, can therefore be in flight
+    while earlier responses are still on the wire.
+
+    Needs a port with a file descriptor (POSIX).
+    """
+
+    # How often the reader wakes up to check for close() (seconds)
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, port: str, baudrate: int = 115200,
+                 timeout: float = _CMD_TIMEOUT):
+        super().__init__(port, baudrate, timeout)
+        if self._fd is None:
+            self._ser.close()
+            raise GreyMatterError(
+                "Background reader needs a serial port with a file descriptor"
+            )
+        # Outstanding commands, oldest first; the firmware answers in order
+        self._waiters: deque[Future] = deque()
+        # Prompts still owed to waiters failed after a timeout; the reader
+        # drops this many replies before resolving anyone else
+        self._discard = 0
+        self._rx_lock = threading.Lock()
+        self._error: GreyMatterError | None = None
+        self._closing = False
+        self._reader = threading.Thread(
+            target=self._reader_loop, name=f"greymatter-reader-{port}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def submit(self, cmd: str) -> Future:
+        """Send a command without waiting.
+
+        The future resolves to the response body as bytes.
+        """
+        return self._submit(_encode_line(cmd), 1)[0]
+
+    def send_command(self, cmd: str) -> str:
+        return _decode(self._wait(self.submit(cmd)))
+
+    def send_command_bytes(self, cmd: bytes) -> bytes:
+        return self._wait(self._submit(cmd + b"\n", 1)[0])
+
+    def send_commands(self, cmds: list[str]) -> list[str]:
+        if not cmds:
+            return []
+        payload = ("\n".join(cmds) + "\n").encode("ascii")
+        futs = self._submit(payload, len(cmds))
+        return [_decode(self._wait(fut)) for fut in futs]
+
+    def close(self) -> None:
+        self._closing = True
+        self._reader.join()
+        super().close()
+
+    def _submit(self, payload: bytes, count: int) -> list[Future]:
+        futs = [Future() for _ in range(count)]
+        with self._lock:
+            self._check_open()
+            # Register before writing so a fast reply always finds its
+            # waiter. This happens under the reader's lock, as a timeout in
+            # _wait counts and fails the waiters under it too; if one struck
+            # since the last resync, resync again first.
+            while True:
+                if self._unanswered:
+                    self._resync()
+                with self._rx_lock:
+                    if self._error is not None:
+                        raise self._error
+                    if not self._unanswered:
+                        self._waiters.extend(futs)
+                        break
+            try:
+                self._write(payload)
+            except GreyMatterError:
+                self._resync()
+                raise
+        return futs
+
+    def _wait(self, fut: Future) -> bytes:
+        try:
+            return fut.result(self._ser.timeout)
+        except FutureTimeoutError:
+            pass
+        # The reply may be late or may never come, so no later reply can
+        # be trusted to belong to the next waiter. Fail every outstanding
+        # command and have the next submit resync first.
+        with self._rx_lock:
+            if fut.done() and fut.exception() is None:
+                return fut.result()
+            self._discard += len(self._waiters)
+            self._fail_waiters(GreyMatterError("Discarded after a timeout"))
+            self._unanswered = 1
+        raise GreyMatterError("Timeout waiting for response")
+
+    def _write(self, data: bytes) -> None:
+        # The reader thread keeps draining input, so only wait for room
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(self._fd, view):]
+                continue
+            except BlockingIOError:
+                pass
+            if not select.select([], [self._fd], [], self._ser.timeout)[1]:
+                raise GreyMatterError("Timeout writing command")
+
+    def _resync(self) -> None:
+        # Give the reader a chance to consume the replies still owed, as
+        # SerialTransport does, before flushing whatever is left
+        deadline = time.monotonic() + max(self._ser.timeout or 0.0,
+                                          _CMD_TIMEOUT)
+        while self._discard and time.monotonic() < deadline:
+            time.sleep(_RESYNC_QUIET)
+        with self._rx_lock:
+            self._ser.reset_input_buffer()
+            self._rxbuf.clear()
+            self._fail_waiters(GreyMatterError("Discarded by resync"))
+            self._discard = 0
+            self._unanswered = 0
+
+    def _fail_waiters(self, exc: GreyMatterError) -> None:
+        while self._waiters:
+            self._waiters.popleft().set_exception(exc)
+
+    def _reader_loop(self) -> None:
+        buf = self._rxbuf
+        while not self._closing:
+            if not select.select([self._fd], [], [], self._POLL_INTERVAL)[0]:
+                continue
+            with self._rx_lock:
+                try:
+                    self._read_chunk()
+                except (GreyMatterError, OSError) as exc:
+                    self._error = GreyMatterError(f"Serial reader stopped: {exc}")
+                    self._fail_waiters(self._error)
+                    return
+                while (idx := buf.find(_PROMPT)) >= 0:
+                    end = idx + len(_PROMPT)
+                    # Replies owed to failed waiters, or with no one waiting
+                    # (e.g. stray prompts), are dropped
+                    if self._discard:
+                        self._discard -= 1
+                    elif self._waiters:
+                        self._waiters.popleft().set_result(
+                            self._parse_response(buf, end)
+                        )
+                    del buf[:end]
+
+
 class ZmqTransport(Transport):
     """Remote connection to a greymatter board via a ZMQ server.
 
     The server manages the serial connections and routes commands
     to the correct Pico board.
+
+    Requests go out on a DEALER socket tagged with a correlation id, so
+    several can be in flight at once (from concurrent threads) and each
+    reply is matched to its caller by id.  ``send_batch`` ships a list of
+    commands as a single request, which the server pipelines to the Pico.
+
+    Transports to the same server share one connection (socket, I/O
+    thread and ZMQ context), which is closed when the last of them is.
     """
 
     def __init__(self, address: str, pico: str | None = None,
                  port: int = 5556, timeout: float = 10.0):
-        import zmq
         self._pico = pico
+        self._timeout = timeout
+        # Request JSON up to the id, which never changes for this transport
+        self._head = b'{"pico":' + _json.dumps(pico) + b',"id":'
+        self._conn: _ZmqConnection | None = _ZmqConnection.acquire(
+            address, port, timeout
+        )
+
+    def send_command(self, cmd: str) -> str:
+        return self._wait(*self._submit(b',"cmd":' + _json.dumps(cmd) + b"}"))
+
+    def send_batch(self, cmds: list[str]) -> list[str]:
+        """Send *cmds* in one request and return their response bodies.
+
+        Responses come back in order and include any ``ERROR:`` replies
+        from the firmware; GreyMatterError is raised only if the batch as
+        a whole fails (timeout, serial error, unknown pico).
+        """
+        return self._wait(
+            *self._submit(b',"cmds":' + _json.dumps(cmds) + b"}")
+        )
+
+    def send_commands(self, cmds: list[str]) -> list[str]:
+        return self.send_batch(cmds)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.release()
+
+    def _submit(self, tail: bytes) -> tuple[int, Future]:
+        conn = self._conn
+        if conn is None:
+            raise GreyMatterError("Transport is closed")
+        return conn.submit(self._head, tail)
+
+    def _wait(self, req_id: int, fut: Future):
+        try:
+            reply = fut.result(self._timeout)
+        except FutureTimeoutError:
+            # close() may have run on another thread meanwhile
+            conn = self._conn
+            if conn is not None:
+                conn.forget(req_id)
+            raise GreyMatterError("Server timeout") from None
+
+        if reply.get("ok"):
+            return reply.get("data", "")
+        else:
+            raise GreyMatterError(
+                reply.get("error", "Unknown server error")
+            )
+
+
+# Open server connections, keyed by (address, port)
+_ZMQ_POOL: dict[tuple[str, int], _ZmqConnection] = {}
+_ZMQ_POOL_LOCK = threading.Lock()
+
+
+class _ZmqConnection:
+    """A DEALER connection to one server, shared by its ZmqTransports.
+
+    The socket is owned by a background I/O thread; callers hand it
+    requests over an inproc pipe.
+    """
+
+    @classmethod
+    def acquire(cls, address: str, port: int,
+                timeout: float) -> _ZmqConnection:
+        """Return the pooled connection to a server, opening it if needed.
+
+        The socket's send timeout comes from *timeout* of whichever
+        transport opened the connection; later transports share it, but
+        each still waits for its replies with its own timeout.
+        """
+        key = (address, port)
+        with _ZMQ_POOL_LOCK:
+            conn = _ZMQ_POOL.get(key)
+            # A connection inherited across fork() can't be used
+            if conn is None or conn._pid != os.getpid():
+                conn = _ZMQ_POOL[key] = cls(address, port, timeout)
+            conn._refs += 1
+        return conn
+
+    def __init__(self, address: str, port: int, timeout: float):
+        if zmq is None:
+            raise ImportError(
+                "Remote connections require pyzmq "
+                "(pip install greymatter[server])"
+            )
+        self._key = (address, port)
+        self._pid = os.getpid()
+        self._refs = 0
         self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._inflight: dict[int, Future] = {}
+
         self._context = zmq.Context()
-        self._socket = self._context.socket(zmq.REQ)
-        self._socket.setsockopt(zmq.RCVTIMEO, int(timeout * 1000))
+        self._socket = self._context.socket(zmq.DEALER)
+        # A fixed identity lets the server route replies to requests that
+        # were in flight across a TCP reconnect
+        self._socket.setsockopt(zmq.IDENTITY, uuid.uuid4().bytes)
         self._socket.setsockopt(zmq.SNDTIMEO, int(timeout * 1000))
         self._socket.setsockopt(zmq.LINGER, 1000)
+        # Fail sends while the server is unreachable rather than queueing
+        # them for a connection that may never come
+        self._socket.setsockopt(zmq.IMMEDIATE, 1)
+        self._socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
         self._socket.connect(f"tcp://{address}:{port}")
 
-    def send_command(self, cmd: str) -> str:
-        import json
-        import zmq
+        endpoint = f"inproc://greymatter-zmq-{id(self)}"
+        self._pipe = self._context.socket(zmq.PAIR)
+        self._pipe.bind(endpoint)
+        pipe_end = self._context.socket(zmq.PAIR)
+        pipe_end.connect(endpoint)
+
+        self._io_thread = threading.Thread(
+            target=self._io_loop, args=(pipe_end,),
+            name=f"greymatter-zmq-{address}:{port}", daemon=True,
+        )
+        self._io_thread.start()
 
+    def submit(self, head: bytes, tail: bytes) -> tuple[int, Future]:
+        """Send a request tagged with a fresh id; return the id and future.
+
+        The request JSON is *head*, the id, then *tail*, so callers can
+        encode everything but the id ahead of time.
+        """
+        fut: Future = Future()
         with self._lock:
-            request = json.dumps({"pico": self._pico, "cmd": cmd})
-            try:
-                self._socket.send_string(request)
-                reply = json.loads(self._socket.recv_string())
-            except zmq.Again:
-                raise GreyMatterError("Server timeout")
-
-            if reply.get("ok"):
-                return reply.get("data", "")
-            else:
-                raise GreyMatterError(
-                    reply.get("error", "Unknown server error")
-                )
+            req_id = next(self._ids)
+            self._inflight[req_id] = fut
+            self._pipe.send(b"%s%d%s" % (head, req_id, tail))
+        return req_id, fut
 
-    def close(self) -> None:
-        self._socket.close()
+    def forget(self, req_id: int) -> None:
+        """Stop waiting for a request; its reply will be dropped."""
+        self._inflight.pop(req_id, None)
+
+    def release(self) -> None:
+        """Drop one reference, closing the connection with the last."""
+        with _ZMQ_POOL_LOCK:
+            self._refs -= 1
+            if self._refs:
+                return
+            if _ZMQ_POOL.get(self._key) is self:
+                del _ZMQ_POOL[self._key]
+        with self._lock:
+            self._pipe.send(b"")
+        self._io_thread.join()
+        self._pipe.close()
         self._context.destroy()
+
+    def _io_loop(self, pipe) -> None:
+        """Shuttle requests out and resolve replies by id until closed."""
+        poller = zmq.Poller()
+        poller.register(pipe, zmq.POLLIN)
+        poller.register(self._socket, zmq.POLLIN)
+        try:
+            while True:
+                events = dict(poller.poll())
+                if pipe in events:
+                    payload = pipe.recv()
+                    if not payload:
+                        return
+                    try:
+                        # Empty delimiter frame, as a REQ socket would send
+                        self._socket.send_multipart([b"", payload])
+                    except zmq.Again:
+                        req_id = _json.loads(payload)["id"]
+                        fut = self._inflight.pop(req_id, None)
+                        if fut is not None:
+                            fut.set_exception(GreyMatterError("Server timeout"))
+                if self._socket in events:
+                    try:
+                        reply = _json.loads(
+                            self._socket.recv_multipart(copy=False)[-1].buffer
+                        )
+                    except ValueError:
+                        continue
+                    # Replies to requests that already timed out are dropped
+                    fut = self._inflight.pop(reply.get("id"), None)
+                    if fut is not None:
+                        fut.set_result(reply)
+        finally:
+            pipe.close()
+            self._socket.close()